@@ -3,12 +3,11 @@ OpenAlex MCP Server initialization
 """
 
 from . import server
-import asyncio
 
 
 def main():
     """Main entry point for the package."""
-    asyncio.run(server.main())
+    server.start_server()
 
 
 __all__ = ["main", "server"]
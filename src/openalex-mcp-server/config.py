@@ -2,12 +2,15 @@
 
 import sys
 import logging 
+from functools import lru_cache
 from pathlib import Path
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Settings for the OpenAlex MCP Server"""
+    model_config = SettingsConfigDict(env_prefix="OPENALEX_", case_sensitive=True)
+    
     APP_NAME: str = "openalex-mcp-server"
     VERSION: str = "1.0.0"
     LOG_LEVEL: str = "INFO"
@@ -16,7 +19,22 @@ class Settings(BaseSettings):
     # API settings
     API_BASE_URL: str = "https://api.openalex.org"
     API_TIMEOUT: float = 10.0  # Timeout in seconds
+    API_MAX_CONCURRENCY: int = 16  # Maximum requests in flight to OpenAlex at once
+    API_MAX_RETRIES: int = 3  # Retries for throttled (429) or unavailable (503) responses
+    API_RETRY_BACKOFF: float = 0.5  # Initial retry delay in seconds, doubled on each attempt
+    POOL_LIMIT: int = 256  # Maximum concurrent connections
+    POOL_MAX_KEEPALIVE: int = 128  # Maximum idle connections kept open for reuse
+    BATCH_WINDOW: float = 0.02  # Seconds to wait for more paper lookups before batching
+    BATCH_SIZE: int = 50  # Maximum paper IDs fetched in a single batched request
     
-    class Config:
-        env_prefix = "OPENALEX_"
-        case_sensitive = True
\ No newline at end of file
+    # Cache settings
+    PAPER_CACHE_SIZE: int = 2048  # Maximum number of formatted papers kept in memory
+    PAPER_CACHE_TTL: float = 3600.0  # Time-to-live for cached papers in seconds
+    SEARCH_CACHE_SIZE: int = 512  # Maximum number of search summaries kept in memory
+    SEARCH_CACHE_TTL: float = 600.0  # Time-to-live for cached search summaries in seconds
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, reading the environment only once"""
+    return Settings()
@@ -8,10 +8,10 @@ This is the main entry point for the OpenAlex MCP Server.
 import sys
 import logging
 from .server import start_server
-from .config import Settings
+from .config import get_settings
 
 # Configure logging
-settings = Settings()
+settings = get_settings()
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -24,13 +24,13 @@ logger = logging.getLogger(settings.APP_NAME)
 
 def main():
     """Main entry point for the OpenAlex MCP Server"""
-    logger.info(f"Starting {settings.APP_NAME} v{settings.VERSION}")
+    logger.info("Starting %s v%s", settings.APP_NAME, settings.VERSION)
     try:
         start_server()
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Error running server: {e}", exc_info=True)
+        logger.error("Error running server: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -8,189 +8,531 @@ This module implements an MCP server for interacting with OpenAlex
 
 import logging
 import json
+import re
 import asyncio
-import aiohttp
-from typing import Dict, Any, List, Optional, Union
-from urllib.parse import quote
+import time
+import httpx
+import orjson
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Set, Tuple, TypedDict, Union
+from urllib.parse import quote, quote_plus
 from mcp.server.fastmcp import FastMCP
 from mcp.types import TextContent, ResourceContents
 
-from .config import Settings
+from .config import get_settings
 
 # Initialize settings and logging
-settings = Settings()
+settings = get_settings()
 logger = logging.getLogger("openalex-mcp-server")
 logger.setLevel(getattr(logging, settings.LOG_LEVEL))
 
+# Request constants, built once at import so each call only fills in the variable parts
+_HEADERS = {'User-Agent': 'OpenAlexMCPServer/1.0'}
+
+# Only request the fields that format_paper_details and generate_search_summary read
+_SELECT_DETAIL = "id,title,publication_year,cited_by_count,authorships,open_access,primary_location,abstract_inverted_index,doi"
+_SELECT_LIST = "id,title,publication_year,authorships,cited_by_count"
+
+_WORKS_URL_TMPL = f"{settings.API_BASE_URL}/works?{{params}}&per_page={{n}}&sort=cited_by_count:desc&select={_SELECT_LIST}&mailto={settings.API_EMAIL}"
+_WORK_URL_TMPL = f"{settings.API_BASE_URL}/works/{{id}}?select={_SELECT_DETAIL}&mailto={settings.API_EMAIL}"
+_WORK_BATCH_URL_TMPL = f"{settings.API_BASE_URL}/works?filter=openalex_id:{{ids}}&per_page={{n}}&select={_SELECT_DETAIL}&mailto={settings.API_EMAIL}"
+
+# Shared HTTP client, created lazily on first use and reused for the process lifetime
+_client: Optional[httpx.AsyncClient] = None
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP/2 client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,  # OpenAlex redirects merged work IDs
+            timeout=settings.API_TIMEOUT,
+            headers=_HEADERS,
+            limits=httpx.Limits(
+                max_connections=settings.POOL_LIMIT,
+                max_keepalive_connections=settings.POOL_MAX_KEEPALIVE,
+                keepalive_expiry=60
+            )
+        )
+    return _client
+
+async def close_client() -> None:
+    """Close the shared HTTP client if it is open"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+# Bounds concurrent requests to OpenAlex to stay within its rate limits
+_api_sem = asyncio.Semaphore(settings.API_MAX_CONCURRENCY)
+
+# Responses that signal throttling or a temporary outage and are worth retrying
+_RETRY_STATUSES = frozenset({429, 503})
+_MAX_RETRY_DELAY = 30.0  # Upper bound in seconds, even if Retry-After asks for longer
+
+async def _api_get(url: str) -> httpx.Response:
+    """
+    Send a GET request to OpenAlex through the shared client
+    
+    At most API_MAX_CONCURRENCY requests are in flight at once. 429 and 503
+    responses are retried with exponential backoff, honouring Retry-After.
+    
+    Args:
+        url: Fully built OpenAlex API URL
+        
+    Returns:
+        The final response, which may still be an error after the last retry
+    """
+    client = await get_client()
+    attempt = 0
+    while True:
+        async with _api_sem:
+            response = await client.get(url)
+        
+        if response.status_code not in _RETRY_STATUSES or attempt >= settings.API_MAX_RETRIES:
+            return response
+        
+        try:
+            delay = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            delay = settings.API_RETRY_BACKOFF * 2 ** attempt
+        delay = min(delay, _MAX_RETRY_DELAY)
+        attempt += 1
+        
+        logger.warning("OpenAlex API returned %d, retrying in %.2fs (attempt %d of %d)", response.status_code, delay, attempt, settings.API_MAX_RETRIES)
+        await asyncio.sleep(delay)
+
+class _TTLCache:
+    """Small LRU cache whose entries expire after a fixed time-to-live"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries"""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+# Formatted paper details keyed by cleaned paper ID
+_paper_cache = _TTLCache(settings.PAPER_CACHE_SIZE, settings.PAPER_CACHE_TTL)
+
+# Search summaries keyed by (title, query, filter, limit), since agent loops often repeat searches
+_search_cache = _TTLCache(settings.SEARCH_CACHE_SIZE, settings.SEARCH_CACHE_TTL)
+
+# In-flight paper fetches, so concurrent requests for the same ID share one upstream call
+_inflight: Dict[str, "asyncio.Task[Optional[str]]"] = {}
+
+# Leading scheme and host of paper IDs given as URLs, e.g. https://openalex.org/W2741809807
+_URL_PREFIX_RE = re.compile(r"^(?:https?://)?[^/]+/")
+
+# Work IDs that can be looked up together through the openalex_id filter
+_WORK_ID_RE = re.compile(r"^[Ww]\d+$")
+
+# Work lookups waiting for the next batched request, keyed by upper-cased work ID
+_pending_works: Dict[str, "asyncio.Future[Optional[WorkTD]]"] = {}
+_batch_timer: Optional[asyncio.TimerHandle] = None
+_batch_tasks: Set["asyncio.Task[None]"] = set()
+
 # Create server instance
 server = FastMCP(
     name=settings.APP_NAME,
     instructions="OpenAlex MCP server allows you to search and retrieve academic papers from the OpenAlex database."
 )
 
+# Helper function to decode OpenAlex abstracts
+def reconstruct_abstract(inverted_index: Optional[Dict[str, List[int]]]) -> str:
+    """Rebuild abstract text from OpenAlex's inverted index of {word: [positions]}"""
+    if not inverted_index:
+        return ""
+    
+    # Place each word directly at its positions instead of sorting them
+    size = 1 + max((max(positions) for positions in inverted_index.values() if positions), default=-1)
+    words = [""] * size
+    for word, positions in inverted_index.items():
+        for position in positions:
+            words[position] = word
+    
+    return " ".join(filter(None, words))
+
+# Shapes of the OpenAlex work fields read by the formatters
+class AuthorshipTD(TypedDict, total=False):
+    author: Optional[Dict[str, Any]]
+    institutions: List[Dict[str, Any]]
+
+class WorkTD(TypedDict, total=False):
+    id: str
+    title: Optional[str]
+    publication_year: Optional[int]
+    cited_by_count: int
+    authorships: List[AuthorshipTD]
+    open_access: Optional[Dict[str, Any]]
+    primary_location: Optional[Dict[str, Any]]
+    abstract_inverted_index: Optional[Dict[str, List[int]]]
+    doi: Optional[str]
+
+AUTHOR_LIMIT = 20  # Limit number of authors to display
+
+@dataclass(slots=True)
+class PaperView:
+    """Flat view of the fields format_paper_details needs, extracted once per paper"""
+    title: str
+    year: Any
+    citations: int
+    authors: List[Tuple[str, Optional[str]]]  # (name, first institution) for displayed authors
+    author_count: int
+    is_oa: bool
+    oa_url: str
+    venue: str
+    doi: Optional[str]
+    abstract: str
+    landing_page_url: Optional[str]
+
+# Helper function to extract a single authorship entry
+def _to_author(authorship: AuthorshipTD) -> Tuple[str, Optional[str]]:
+    """Return (author name, first institution name) for an authorship"""
+    author = authorship.get("author")
+    if not author:
+        return ("Unknown Author", None)
+    
+    institutions = authorship.get("institutions")
+    institution = institutions[0].get("display_name") if institutions else None
+    return (author.get("display_name", "Unknown Author"), institution)
+
+# Helper function to extract the formatting fields from an OpenAlex work
+def _to_view(paper: WorkTD) -> PaperView:
+    """Build a PaperView from a raw OpenAlex work, applying display defaults"""
+    authorships = paper.get("authorships") or []
+    open_access = paper.get("open_access") or {}
+    primary_location = paper.get("primary_location") or {}
+    source = primary_location.get("source")
+    
+    return PaperView(
+        title=paper.get("title", "Untitled Paper"),
+        year=paper.get("publication_year", "Year unknown"),
+        citations=paper.get("cited_by_count", 0),
+        authors=[_to_author(authorship) for authorship in authorships[:AUTHOR_LIMIT]],
+        author_count=len(authorships),
+        is_oa=open_access.get("is_oa", False),
+        oa_url=open_access.get("oa_url", ""),
+        venue=source.get("display_name", "Unknown Venue") if source else "Unknown Venue",
+        doi=paper.get("doi"),
+        abstract=reconstruct_abstract(paper.get("abstract_inverted_index")) or "No abstract available",
+        landing_page_url=primary_location.get("landing_page_url")
+    )
+
+# Helper function to format a single author
+def _format_author(author: Tuple[str, Optional[str]]) -> str:
+    """Format an author as 'Author (Institution)', omitting a missing institution"""
+    name, institution = author
+    return f"{name} ({institution})" if institution else name
+
+# Markdown skeleton for a paper's details, filled in by format_paper_details
+_PAPER_TMPL = """# {title}
+
+## Publication Information
+- **Year:** {year}
+- **Venue:** {venue}
+- **DOI:** {doi}
+- **Citations:** {citations}
+- **{access_info}**
+
+## Authors
+{authors}{author_truncation_note}
+
+## Abstract
+{abstract}{abstract_truncation_note}
+
+## Links
+{links}
+"""
+
 # Helper function to format paper details
-def format_paper_details(paper: Dict[str, Any]) -> str:
-    """Format a paper's details into a readable markdown string"""
+def format_paper_details(paper: WorkTD) -> Optional[str]:
+    """Format a paper's details into a readable markdown string, or None if the data cannot be formatted"""
     try:
-        if not paper:
-            raise ValueError("Invalid paper data")
-
-        # Safety checks and default values
-        title = paper.get("title", "Untitled Paper")
-        year = paper.get("publication_year", "Year unknown")
-        citations = paper.get("cited_by_count", 0)
+        view = _to_view(paper)
         
         # Format authors list with truncation for very long lists
-        authorships_list = paper.get("authorships", [])
-        author_limit = 20  # Limit number of authors to display
-        
         authors = "No author information available"
         author_truncation_note = ""
         
-        if authorships_list and len(authorships_list) > 0:
-            displayed_authorships = authorships_list[:author_limit]
-            truncated = len(authorships_list) > author_limit
-            
-            authors_list = []
-            for authorship in displayed_authorships:
-                if not authorship.get("author"):
-                    authors_list.append("Unknown Author")
-                    continue
-                
-                author = authorship["author"].get("display_name", "Unknown Author")
-                institutions = authorship.get("institutions", [])
-                institution = institutions[0].get("display_name") if institutions else None
-                
-                if institution:
-                    authors_list.append(f"{author} ({institution})")
-                else:
-                    authors_list.append(author)
-            
-            authors = ", ".join(authors_list)
+        if view.authors:
+            authors = ", ".join(map(_format_author, view.authors))
             
-            if truncated:
-                remaining_count = len(authorships_list) - author_limit
-                author_truncation_note = f"\n\n*Note: This paper has {len(authorships_list)} authors. Showing first {author_limit} only.*"
+            if view.author_count > AUTHOR_LIMIT:
+                author_truncation_note = f"\n\n*Note: This paper has {view.author_count} authors. Showing first {AUTHOR_LIMIT} only.*"
         
         # Format access information
-        open_access = paper.get("open_access", {})
-        is_oa = open_access.get("is_oa", False)
-        oa_url = open_access.get("oa_url", "")
-        
-        if is_oa:
-            access_info = f"Open Access: Yes{f' (URL: {oa_url})' if oa_url else ''}"
+        if view.is_oa:
+            access_info = f"Open Access: Yes{f' (URL: {view.oa_url})' if view.oa_url else ''}"
         else:
             access_info = "Open Access: No"
-
-        # Format journal/venue information
-        primary_location = paper.get("primary_location", {})
-        source = primary_location.get("source", {})
-        venue = source.get("display_name", "Unknown Venue") if source else "Unknown Venue"
         
         # Handle potentially long abstracts
-        abstract = paper.get("abstract", "No abstract available")
+        abstract = view.abstract
         max_abstract_length = 5000  # Reasonable limit for abstract length
-        truncated_abstract = abstract
         abstract_truncation_note = ""
         
         if len(abstract) > max_abstract_length:
-            truncated_abstract = abstract[:max_abstract_length] + "..."
+            abstract = abstract[:max_abstract_length] + "..."
             abstract_truncation_note = "\n\n*Note: Abstract has been truncated due to length.*"
         
         # Build links section
         links = []
-        landing_page_url = primary_location.get("landing_page_url")
-        doi = paper.get("doi")
-        
-        if landing_page_url:
-            links.append(f"- [Publication Page]({landing_page_url})")
-        if doi:
-            links.append(f"- [DOI Link](https://doi.org/{doi})")
+        if view.landing_page_url:
+            links.append(f"- [Publication Page]({view.landing_page_url})")
+        if view.doi:
+            links.append(f"- [DOI Link](https://doi.org/{view.doi})")
         
         links_section = "\n".join(links) if links else "No links available"
-    
+        
         # Build the formatted paper details
-        return f"""# {title}
-
-## Publication Information
-- **Year:** {year}
-- **Venue:** {venue}
-- **DOI:** {paper.get("doi", "Not available")}
-- **Citations:** {citations}
-- **{access_info}**
-
-## Authors
-{authors}{author_truncation_note}
-
-## Abstract
-{truncated_abstract}{abstract_truncation_note}
-
-## Links
-{links_section}
-"""
+        return _PAPER_TMPL.format_map({
+            "title": view.title,
+            "year": view.year,
+            "venue": view.venue,
+            "doi": view.doi or "Not available",
+            "citations": view.citations,
+            "access_info": access_info,
+            "authors": authors,
+            "author_truncation_note": author_truncation_note,
+            "abstract": abstract,
+            "abstract_truncation_note": abstract_truncation_note,
+            "links": links_section
+        })
     except Exception as e:
-        logger.error(f"Error formatting paper details: {e}")
-        return "Error: Unable to format paper details. This may be due to unexpected data structure from the API."
+        logger.error("Error formatting paper details: %s", e)
+        return None
+
+# Helper function to build a works listing URL
+def _build_works_url(*, search: Optional[str] = None, filter: Optional[str] = None, limit: int) -> str:
+    """
+    Build an OpenAlex works URL for a full-text search, a filter, or both
+    
+    The search text is encoded once with quote_plus. Filter syntax (":", "|", ",")
+    is left as-is so OpenAlex parses it as a filter rather than literal text.
+    """
+    params = []
+    if search:
+        params.append(f"search={quote_plus(search)}")
+    if filter:
+        params.append(f"filter={quote(filter, safe=':|,.!<>')}")
+    return _WORKS_URL_TMPL.format(params="&".join(params), n=limit)
 
 # Helper function to search papers via OpenAlex API
-async def search_papers(query: str, limit: int = 10) -> List[Dict[str, Any]]:
+async def search_papers(
+    query: Optional[str] = None,
+    limit: int = 10,
+    filter: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """
     Search for papers in OpenAlex API
     
     Args:
         query: Search query for finding papers
         limit: Maximum number of results to return
+        filter: OpenAlex filter expression, e.g. raw_author_name.search:Jane Doe
         
     Returns:
         List of paper objects from OpenAlex API
     """
     try:
         # Validate inputs
-        if not query or query.strip() == "":
+        if (not query or query.strip() == "") and (not filter or filter.strip() == ""):
             raise ValueError("Search query cannot be empty")
         
         # Cap the limit to avoid excessive data
         safe_limit = min(max(1, limit), 50)
         
-        # Email for polite API usage (optional)
-        email = "researcher@example.com"
-        
         # Build and encode the query URL
-        encoded_query = quote(query)
-        url = f"https://api.openalex.org/works?search={encoded_query}&per_page={safe_limit}&sort=cited_by_count:desc&mailto={email}"
-        
-        logger.info(f'Searching OpenAlex for: "{query}" (limit: {safe_limit})')
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url, 
-                headers={'User-Agent': 'OpenAlexMCPServer/1.0'},
-                timeout=15.0  # 15 second timeout
-            ) as response:
-                if response.status == 404:
-                    logger.warning(f"No results found for query: {query}")
-                    return []
-                
-                if not response.ok:
-                    raise ValueError(f"OpenAlex API error: {response.status} {response.reason}")
-                
-                data = await response.json()
-                
-                # Handle empty results case
-                if not data.get("results") or len(data["results"]) == 0:
-                    logger.info(f'No results found for query: "{query}"')
-                    return []
-                
-                return data["results"]
-    except asyncio.TimeoutError:
+        url = _build_works_url(search=query, filter=filter, limit=safe_limit)
+        description = query or filter
+        
+        logger.info('Searching OpenAlex for: "%s" (limit: %d)', description, safe_limit)
+        
+        response = await _api_get(url)
+        if response.status_code == 404:
+            logger.warning("No results found for query: %s", description)
+            return []
+        
+        if not response.is_success:
+            raise ValueError(f"OpenAlex API error: {response.status_code} {response.reason_phrase}")
+        
+        data = orjson.loads(response.content)
+        
+        # Handle empty results case
+        if not data.get("results") or len(data["results"]) == 0:
+            logger.info('No results found for query: "%s"', description)
+            return []
+        
+        return data["results"]
+    except httpx.TimeoutException:
         logger.error("Request timeout: The OpenAlex API took too long to respond")
         return []
     except Exception as e:
-        logger.error(f"Error searching papers: {e}")
+        logger.error("Error searching papers: %s", e)
         return []
 
+# Helper function to normalize paper IDs given as URLs
+def _clean_paper_id(paper_id: str) -> str:
+    """Strip any leading scheme and host so only the OpenAlex ID remains"""
+    return _URL_PREFIX_RE.sub("", paper_id, count=1)
+
+# Helper function to fetch and format a single paper via OpenAlex API
+async def fetch_paper_details(paper_id: str) -> Optional[str]:
+    """
+    Fetch a paper from OpenAlex and format it as markdown, using the in-process cache
+    
+    Concurrent calls for the same ID are coalesced into a single upstream request.
+    
+    Args:
+        paper_id: Cleaned OpenAlex ID of the paper
+        
+    Returns:
+        Formatted paper details, or None if no paper exists with that ID
+    """
+    paper_details = _paper_cache.get(paper_id)
+    if paper_details is not None:
+        return paper_details
+    
+    task = _inflight.get(paper_id)
+    if task is None:
+        task = asyncio.create_task(_load_paper_details(paper_id))
+        _inflight[paper_id] = task
+        task.add_done_callback(lambda _: _inflight.pop(paper_id, None))
+    
+    # Shield the shared fetch so one caller being cancelled does not cancel it for the others
+    return await asyncio.shield(task)
+
+async def _load_paper_details(paper_id: str) -> Optional[str]:
+    """Fetch and format a paper from OpenAlex, storing the result in the cache"""
+    paper = await _load_work(paper_id)
+    if paper is None:
+        return None
+    
+    # Check if we got a valid paper object
+    if not paper.get("id") or not paper.get("title"):
+        raise ValueError("Invalid or incomplete paper data received")
+    
+    # Format off the event loop so other in-flight responses are not held up
+    paper_details = await asyncio.to_thread(format_paper_details, paper)
+    if paper_details is None:
+        # Not cached, so the next request fetches the paper again
+        raise ValueError("Unable to format paper details. This may be due to unexpected data structure from the API.")
+    
+    _paper_cache.put(paper_id, paper_details)
+    return paper_details
+
+async def _load_work(paper_id: str) -> Optional[WorkTD]:
+    """
+    Load a raw work object from OpenAlex
+    
+    Plain work IDs are queued and fetched together with any other IDs requested
+    within the batching window; other identifiers are fetched directly.
+    """
+    if not _WORK_ID_RE.match(paper_id):
+        return await _fetch_work(paper_id)
+    
+    global _batch_timer
+    key = paper_id.upper()
+    future = _pending_works.get(key)
+    if future is None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        _pending_works[key] = future
+        if len(_pending_works) >= settings.BATCH_SIZE:
+            _flush_work_batch()
+        elif _batch_timer is None:
+            _batch_timer = loop.call_later(settings.BATCH_WINDOW, _flush_work_batch)
+    
+    return await future
+
+async def _fetch_work(paper_id: str) -> Optional[WorkTD]:
+    """Fetch a single work from OpenAlex, returning None if it does not exist"""
+    response = await _api_get(_WORK_URL_TMPL.format(id=paper_id))
+    if response.status_code == 404:
+        return None
+    
+    if not response.is_success:
+        raise ValueError(f"OpenAlex API error: {response.status_code} {response.reason_phrase}")
+    
+    return orjson.loads(response.content) or None
+
+def _flush_work_batch() -> None:
+    """Send all queued work IDs to OpenAlex as one batched request"""
+    global _batch_timer
+    if _batch_timer is not None:
+        _batch_timer.cancel()
+        _batch_timer = None
+    
+    batch = dict(_pending_works)
+    _pending_works.clear()
+    if batch:
+        task = asyncio.create_task(_fetch_work_batch(batch))
+        _batch_tasks.add(task)
+        task.add_done_callback(_batch_tasks.discard)
+
+async def _fetch_work_batch(batch: Dict[str, "asyncio.Future[Optional[WorkTD]]"]) -> None:
+    """Fetch a batch of works by ID and resolve the futures waiting on them"""
+    try:
+        response = await _api_get(_WORK_BATCH_URL_TMPL.format(ids="|".join(batch), n=len(batch)))
+        if not response.is_success:
+            raise ValueError(f"OpenAlex API error: {response.status_code} {response.reason_phrase}")
+        
+        # Work IDs come back as full URLs, e.g. https://openalex.org/W2741809807
+        works = {
+            work["id"].rsplit("/", 1)[-1].upper(): work
+            for work in orjson.loads(response.content).get("results", [])
+            if work.get("id")
+        }
+        for key, future in batch.items():
+            if key in works and not future.done():
+                future.set_result(works[key])
+        
+        # Merged or retired IDs are missing from filter results but still resolve through a direct lookup
+        missing = [key for key, future in batch.items() if not future.done()]
+        if missing:
+            await asyncio.gather(*(_fetch_work_into(key, batch[key]) for key in missing))
+    except Exception as e:
+        for future in batch.values():
+            if not future.done():
+                future.set_exception(e)
+    finally:
+        for future in batch.values():
+            if not future.done():
+                future.cancel()
+
+async def _fetch_work_into(paper_id: str, future: "asyncio.Future[Optional[WorkTD]]") -> None:
+    """Fetch a single work directly and resolve its waiting future with the outcome"""
+    try:
+        work = await _fetch_work(paper_id)
+    except Exception as e:
+        if not future.done():
+            future.set_exception(e)
+    else:
+        if not future.done():
+            future.set_result(work)
+
 # Function to generate a summary of search results
-def generate_search_summary(query: str, papers: List[Dict[str, Any]]) -> str:
+def generate_search_summary(query: str, papers: List[WorkTD]) -> str:
     """Generate a markdown summary of search results"""
     if not papers or len(papers) == 0:
         return f'No results found for query: "{query}"'
@@ -217,6 +559,38 @@ def generate_search_summary(query: str, papers: List[Dict[str, Any]]) -> str:
     
     return f'# Search Results for: "{query}"\n\n' + "\n\n".join(summaries)
 
+# Helper function to search and summarize, reusing recent summaries
+async def search_and_summarize(
+    title: str,
+    limit: int,
+    query: Optional[str] = None,
+    filter: Optional[str] = None
+) -> str:
+    """
+    Search OpenAlex and return a markdown summary, cached by title, query, filter and limit
+    
+    Args:
+        title: Heading used for the summary
+        limit: Maximum number of results to return
+        query: Search query for finding papers
+        filter: OpenAlex filter expression
+        
+    Returns:
+        Markdown summary of the search results
+    """
+    key = (title, query, filter, limit)
+    summary = _search_cache.get(key)
+    if summary is not None:
+        return summary
+    
+    papers = await search_papers(query, limit, filter=filter)
+    summary = await asyncio.to_thread(generate_search_summary, title, papers)
+    
+    # search_papers returns an empty list on errors too, so only cache actual results
+    if papers:
+        _search_cache.put(key, summary)
+    return summary
+
 @server.tool(name="search_papers")
 async def search_papers_tool(query: str, limit: int = 10) -> Dict[str, Any]:
     """
@@ -229,20 +603,19 @@ async def search_papers_tool(query: str, limit: int = 10) -> Dict[str, Any]:
     Returns:
         List of papers with basic metadata
     """
-    logger.info(f"Searching papers with query: {query}, limit: {limit}")
+    logger.info("Searching papers with query: %s, limit: %s", query, limit)
     
     try:
-        papers = await search_papers(query, limit)
-        summary = generate_search_summary(query, papers)
+        summary = await search_and_summarize(query, limit, query=query)
         
         return {
-            "content": [TextContent(text=summary)]
+            "content": [TextContent(type="text", text=summary)]
         }
     except Exception as e:
         error_message = str(e)
-        logger.error(f"Error in search_papers_tool: {error_message}")
+        logger.error("Error in search_papers_tool: %s", error_message)
         return {
-            "content": [TextContent(text=f"Error searching papers: {error_message}")],
+            "content": [TextContent(type="text", text=f"Error searching papers: {error_message}")],
             "isError": True
         }
 
@@ -258,22 +631,21 @@ async def search_papers_by_author(author: str, limit: int = 10) -> Dict[str, Any
     Returns:
         List of papers by the specified author
     """
-    logger.info(f"Searching papers by author: {author}, limit: {limit}")
+    logger.info("Searching papers by author: %s, limit: %s", author, limit)
     
     try:
-        # Use the author: filter in OpenAlex API
-        query = f'author.display_name:"{author}"'
-        papers = await search_papers(query, limit)
-        summary = generate_search_summary(f"Papers by {author}", papers)
+        # Use the author name filter in OpenAlex API; commas would split it into separate filters
+        author_filter = f"raw_author_name.search:{author.replace(',', ' ')}"
+        summary = await search_and_summarize(f"Papers by {author}", limit, filter=author_filter)
         
         return {
-            "content": [TextContent(text=summary)]
+            "content": [TextContent(type="text", text=summary)]
         }
     except Exception as e:
         error_message = str(e)
-        logger.error(f"Error in search_papers_by_author: {error_message}")
+        logger.error("Error in search_papers_by_author: %s", error_message)
         return {
-            "content": [TextContent(text=f"Error searching papers by author: {error_message}")],
+            "content": [TextContent(type="text", text=f"Error searching papers by author: {error_message}")],
             "isError": True
         }
 
@@ -288,54 +660,82 @@ async def get_paper(paper_id: str) -> Dict[str, Any]:
     Returns:
         Detailed paper information
     """
-    logger.info(f"Getting paper with ID: {paper_id}")
+    logger.info("Getting paper with ID: %s", paper_id)
     
     try:
         # Clean the paper_id - typically they start with "W" followed by numbers
-        clean_paper_id = paper_id.replace("https://", "").replace("http://", "")
-        if "/" in clean_paper_id:
-            clean_paper_id = clean_paper_id.split("/", 1)[1]
-        
-        logger.info(f"Fetching paper details for ID: {clean_paper_id}")
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://api.openalex.org/works/{clean_paper_id}",
-                headers={'User-Agent': 'OpenAlexMCPServer/1.0'},
-                timeout=15.0  # 15 second timeout
-            ) as response:
-                if response.status == 404:
-                    return {
-                        "content": [{"type": "text", "text": f"Paper not found: No paper exists with ID {clean_paper_id}"}],
-                        "isError": True
-                    }
-                
-                if not response.ok:
-                    raise ValueError(f"OpenAlex API error: {response.status} {response.reason}")
-                
-                paper = await response.json()
-                
-                # Check if we got a valid paper object
-                if not paper or not paper.get("id") or not paper.get("title"):
-                    raise ValueError("Invalid or incomplete paper data received")
-                
-                paper_details = format_paper_details(paper)
-                
-                return {
-                    "content": [TextContent(text=paper_details)]
-                }
-    except asyncio.TimeoutError:
+        clean_paper_id = _clean_paper_id(paper_id)
+        
+        logger.info("Fetching paper details for ID: %s", clean_paper_id)
+        
+        paper_details = await fetch_paper_details(clean_paper_id)
+        if paper_details is None:
+            return {
+                "content": [{"type": "text", "text": f"Paper not found: No paper exists with ID {clean_paper_id}"}],
+                "isError": True
+            }
+        
+        return {
+            "content": [TextContent(type="text", text=paper_details)]
+        }
+    except httpx.TimeoutException:
         error_message = "Request timeout: The OpenAlex API took too long to respond"
         logger.error(error_message)
         return {
-            "content": [TextContent(text=error_message)],
+            "content": [TextContent(type="text", text=error_message)],
             "isError": True
         }
     except Exception as e:
         error_message = str(e)
-        logger.error(f"Error in get_paper: {error_message}")
+        logger.error("Error in get_paper: %s", error_message)
         return {
-            "content": [TextContent(text=f"Error fetching paper: {error_message}")],
+            "content": [TextContent(type="text", text=f"Error fetching paper: {error_message}")],
+            "isError": True
+        }
+
+@server.tool(name="get_papers")
+async def get_papers(paper_ids: List[str]) -> Dict[str, Any]:
+    """
+    Get detailed information about several papers at once.
+    
+    Args:
+        paper_ids: The OpenAlex IDs of the papers
+        
+    Returns:
+        Detailed information for each paper
+    """
+    logger.info("Getting %d papers", len(paper_ids))
+    
+    try:
+        if not paper_ids:
+            raise ValueError("At least one paper ID is required")
+        
+        # Clean the paper IDs - typically they start with "W" followed by numbers
+        clean_paper_ids = [_clean_paper_id(paper_id) for paper_id in paper_ids]
+        
+        # Lookups issued together are coalesced into batched OpenAlex requests
+        results = await asyncio.gather(
+            *(fetch_paper_details(clean_paper_id) for clean_paper_id in clean_paper_ids),
+            return_exceptions=True
+        )
+        
+        sections = []
+        for clean_paper_id, result in zip(clean_paper_ids, results):
+            if isinstance(result, BaseException):
+                sections.append(f"Error fetching paper {clean_paper_id}: {result}")
+            elif result is None:
+                sections.append(f"Paper not found: No paper exists with ID {clean_paper_id}")
+            else:
+                sections.append(result)
+        
+        return {
+            "content": [TextContent(type="text", text="\n\n---\n\n".join(sections))]
+        }
+    except Exception as e:
+        error_message = str(e)
+        logger.error("Error in get_papers: %s", error_message)
+        return {
+            "content": [TextContent(type="text", text=f"Error fetching papers: {error_message}")],
             "isError": True
         }
 
@@ -355,47 +755,29 @@ async def paper_resource(paper_id: str) -> Dict[str, Any]:
         )
     
     # Clean the paper_id - typically they start with "W" followed by numbers
-    clean_paper_id = paper_id.replace("https://", "").replace("http://", "")
-    if "/" in clean_paper_id:
-        clean_paper_id = clean_paper_id.split("/", 1)[1]
+    clean_paper_id = _clean_paper_id(paper_id)
     
     try:
-        logger.info(f"Fetching paper resource for ID: {clean_paper_id}")
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://api.openalex.org/works/{clean_paper_id}",
-                headers={'User-Agent': 'OpenAlexMCPServer/1.0'},
-                timeout=15.0  # 15 second timeout
-            ) as response:
-                if response.status == 404:
-                    return ResourceContents(
-                        contents=[{
-                            "uri": f"paper://{paper_id}",
-                            "text": f"Paper not found: No paper exists with ID {clean_paper_id}",
-                            "mime_type": "text/plain"
-                        }]
-                    )
-                
-                if not response.ok:
-                    raise ValueError(f"OpenAlex API error: {response.status} {response.reason}")
-                
-                paper = await response.json()
-                
-                # Check if we got a valid paper object
-                if not paper or not paper.get("id") or not paper.get("title"):
-                    raise ValueError("Invalid or incomplete paper data received")
-                
-                paper_details = format_paper_details(paper)
-                
-                return ResourceContents(
-                    contents=[{
-                        "uri": f"paper://{paper_id}",
-                        "text": paper_details,
-                        "mime_type": "text/markdown"
-                    }]
-                )
-    except asyncio.TimeoutError:
+        logger.info("Fetching paper resource for ID: %s", clean_paper_id)
+        
+        paper_details = await fetch_paper_details(clean_paper_id)
+        if paper_details is None:
+            return ResourceContents(
+                contents=[{
+                    "uri": f"paper://{paper_id}",
+                    "text": f"Paper not found: No paper exists with ID {clean_paper_id}",
+                    "mime_type": "text/plain"
+                }]
+            )
+        
+        return ResourceContents(
+            contents=[{
+                "uri": f"paper://{paper_id}",
+                "text": paper_details,
+                "mime_type": "text/markdown"
+            }]
+        )
+    except httpx.TimeoutException:
         error_message = "Request timeout: The OpenAlex API took too long to respond"
         logger.error(error_message)
         return ResourceContents(
@@ -407,7 +789,7 @@ async def paper_resource(paper_id: str) -> Dict[str, Any]:
         )
     except Exception as e:
         error_message = str(e)
-        logger.error(f"Error retrieving paper resource {clean_paper_id}: {error_message}")
+        logger.error("Error retrieving paper resource %s: %s", clean_paper_id, error_message)
         return ResourceContents(
             contents=[{
                 "uri": f"paper://{paper_id}",
@@ -460,11 +842,21 @@ def find_recent_papers_prompt(
     }
 
 # Server initialization and startup
+async def _serve() -> None:
+    """Serve MCP over stdio on the running event loop until the client disconnects"""
+    # Create the shared HTTP client up front so its connection pool is bound to this loop
+    await get_client()
+    try:
+        logger.info("OpenAlex MCP Server running on stdio.")
+        await server.run_stdio_async()
+    finally:
+        await close_client()
+
 def start_server():
     """Start the MCP server"""
     logger.info("Starting OpenAlex MCP Server...")
-    server.run(transport='stdio')
-    logger.info("OpenAlex MCP Server connected and running.")
+    asyncio.run(_serve())
+    logger.info("OpenAlex MCP Server stopped.")
 
 if __name__ == "__main__":
     start_server()
\ No newline at end of file
@@ -1,9 +1,6 @@
 """Tool definitions for the OpenAlex MCP server."""
 
-from .module_name import tool_name, handle_tool_name
+# Tools are registered on the FastMCP instance in server.py
 
 
-__all__ = [
-    "tool_name",
-    "handle_tool_name",
-]
+__all__ = []